@@ -1,64 +1,453 @@
 
+import asyncio
+import copy
 import requests
-import random
+import secrets
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future
 from typing import Dict, Optional, List
 
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-class PayChanguAPI:
+try:
+    import httpx
+except ImportError:  # only needed for AsyncPayChanguAPI
+    httpx = None
+
+try:
+    import ijson
+except ImportError:  # optional, streams large get_banks() responses
+    ijson = None
+
+try:
+    import orjson as _json
+except ImportError:  # optional speedup, stdlib json otherwise
+    import json as _json
+
+
+# (connect, read) timeout in seconds for every API call
+DEFAULT_TIMEOUT = (3.05, 30)
+
+SUPPORTED_METHODS = frozenset(["GET", "POST"])
+
+# Retry policy for GETs on both clients, POSTs are never retried (could double-charge)
+GET_RETRIES = 3
+RETRY_BACKOFF = 0.5
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+
+# get_banks() responses larger than this are streamed with ijson when installed
+BANKS_STREAM_THRESHOLD = 64 * 1024
+
+AIRTEL_UUID = "e8d5fca0-e5ac-4714-a518-484be9011326"  # Airtel Money
+TNM_UUID = "5e9946ae-76ed-43f5-ad59-63e09096006a"  # TNM Mpamba
+
+# Malawi mobile money provider by leading digit of the national number,
+# anything not listed goes to TNM Mpamba
+_MOBILE_PROVIDERS = {"9": AIRTEL_UUID}
+
+# Verification results in these states never change, so they are cached
+TERMINAL_STATUSES = frozenset(["success", "failed", "cancelled"])
+VERIFY_CACHE_SIZE = 10000
+VERIFY_CACHE_TTL = 3600.0
+
+# Successful POST responses kept per Idempotency-Key so repeats skip the API
+IDEMPOTENCY_CACHE_SIZE = 10000
+
+# Constant fields of payout request bodies, copied per call
+_BANK_PAYOUT_TEMPLATE = {"payout_method": "bank_transfer"}
+_MOBILE_PAYOUT_TEMPLATE = {"payout_method": "mobile_money"}
+
+
+class PayChanguError(Exception):
     """
-    PayChangu API Client
+    Raised by _make_request when a PayChangu API call fails.
     
-    Usage:
-        api = PayChanguAPI(api_key="your_api_key")
-        result = api.create_payment(amount=1000, email="user@email.com", ...)
+    Attributes:
+        status: HTTP status code, None if the request never got a response
+        body: Decoded error response body ({} if there was none)
+        raw_response: Undecoded body, only set when the client has debug=True
+    """
+    
+    def __init__(self, status: Optional[int], body: dict, message: str = None,
+                 raw_response: str = None):
+        self.status = status
+        self.body = body
+        self.raw_response = raw_response
+        super().__init__(message or body.get("message") or f"PayChangu API error (HTTP {status})")
+
+
+def _dumps(obj) -> bytes:
+    #Serialize request body to JSON bytes, Content-Type comes from the client headers
+    data = _json.dumps(obj)
+    return data if isinstance(data, bytes) else data.encode()
+
+
+def _loads(data: bytes):
+    #Parse JSON response body
+    return _json.loads(data)
+
+
+class _TTLCache:
+    """
+    Small LRU cache whose entries also expire ttl seconds after being stored.
+    Safe to share between threads.
+    """
+    
+    __slots__ = ("maxsize", "ttl", "_data", "_lock")
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[object, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        #Return the cached value, or None if missing or expired
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= self.ttl:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return entry[1]
+    
+    def set(self, key, value):
+        #Store value, evicting the least recently used entry when full
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+def _normalize_msisdn(number: str) -> str:
+    #Reduce a Malawi number to its national digits: drops whitespace, the +/00
+    #international prefix, the 265 country code and the trunk 0,
+    #e.g. "+265 99 123 4567" / "00265991234567" / "0991234567" -> "991234567"
+    number = "".join(number.split())
+    if number.startswith("+"):
+        number = number[1:]
+    elif number.startswith("00"):
+        number = number[2:]
+    if number.startswith("265"):
+        number = number[3:]
+    return number.lstrip("0")
+
+
+class _PayChanguBase:
     """
+    Shared payload building and response parsing for the sync and async clients.
+    Subclasses only provide the transport (_make_request) and must declare
+    __slots__ for any attributes they add.
+    """
+    
+    __slots__ = ("api_key", "debug", "base_url", "_banks_cache", "_banks_ttl",
+                 "_verify_cache", "_idempotency_cache")
     
-    def __init__(self, api_key: str):
-        #Initialize with API key
+    def __init__(self, api_key: str, banks_ttl: float = 300.0, debug: bool = False,
+                 idempotency_ttl: float = 60.0):
+        #Initialize with API key, banks_ttl is seconds to cache get_banks() per currency,
+        #debug keeps the undecoded body as PayChanguError.raw_response,
+        #idempotency_ttl is seconds a repeated tx_ref/charge_id returns the earlier successful response
         self.api_key = api_key
+        self.debug = debug
         self.base_url = "https://api.paychangu.com"
-        self.headers = {
-            "Authorization": f"Bearer {api_key}",
+        self._banks_cache: Dict[str, tuple] = {}
+        self._banks_ttl = banks_ttl
+        self._verify_cache = _TTLCache(VERIFY_CACHE_SIZE, VERIFY_CACHE_TTL)
+        self._idempotency_cache = _TTLCache(IDEMPOTENCY_CACHE_SIZE, idempotency_ttl)
+    
+    def _client_headers(self) -> Dict[str, str]:
+        #Headers set once on the HTTP client instead of passed per request.
+        #Content-Type stays because bodies are sent as pre-encoded bytes (see _dumps)
+        return {
+            "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
             "Accept": "application/json"
         }
     
+    def invalidate_banks_cache(self):
+        #Drop cached get_banks() results so the next call refetches
+        self._banks_cache.clear()
+    
+    def _parse_response(self, response) -> dict:
+        #Return the decoded body of a requests/httpx response, raise PayChanguError
+        #on non-2xx or invalid JSON. The body is only decoded when there is one
+        status_code = response.status_code
+        content = response.content
+        raw_response = response.text if self.debug else None
+        try:
+            body = _loads(content) if status_code != 204 and content else {}
+        except ValueError as e:
+            raise PayChanguError(status_code, {}, f"Invalid JSON response: {e}",
+                                 raw_response) from e
+        
+        if not 200 <= status_code < 300:
+            raise PayChanguError(status_code, body if isinstance(body, dict) else {},
+                                 raw_response=raw_response)
+        return body
+    
     def _generate_reference(self, prefix: str = "tx") -> str:
         #Generate unique transaction reference
-        timestamp = int(time.time())
-        random_num = random.randint(100000, 999999)
-        return f"{prefix}_{timestamp}_{random_num}"
+        return f"{prefix}_{time.time_ns()}_{secrets.token_hex(4)}"
     
-    def _make_request(self, method: str, endpoint: str, data: dict = None) -> dict:
-        #Make HTTP request to PayChangu API
-        url = f"{self.base_url}{endpoint}"
+    def _build_payment(self, amount: float, email: str, first_name: str,
+                       last_name: str, callback_url: str, return_url: str,
+                       currency: str, description: Optional[str],
+                       tx_ref: Optional[str] = None) -> Dict:
+        #Build /payment request body
+        payload = {
+            "amount": str(amount),
+            "currency": currency,
+            "email": email,
+            "first_name": first_name,
+            "last_name": last_name,
+            "callback_url": callback_url,
+            "return_url": return_url,
+            "tx_ref": tx_ref or self._generate_reference("payment")
+        }
         
-        try:
-            if method == "GET":
-                response = requests.get(url, headers=self.headers)
-            elif method == "POST":
-                response = requests.post(url, json=data, headers=self.headers)
-            else:
-                raise ValueError(f"Unsupported method: {method}")
-            
-            return {
-                "success": response.status_code in [200, 201],
-                "status_code": response.status_code,
-                "data": response.json() if response.text else {},
-                "raw_response": response.text
+        if description:
+            payload["customization"] = {
+                "title": "Payment",
+                "description": description
             }
-            
+        
+        return payload
+    
+    def _payment_result(self, body: dict, tx_ref: str) -> Dict:
+        #Shape /payment response body
+        if body.get("status") != "success":
+            return self._payment_failed(body, tx_ref)
+        return {
+            "success": True,
+            "checkout_url": body.get("data", {}).get("checkout_url"),
+            "tx_ref": tx_ref,
+            "message": "Payment created successfully"
+        }
+    
+    def _payment_failed(self, body: dict, tx_ref: str) -> Dict:
+        #Shape a failed /payment call, body is the error response body
+        return {
+            "success": False,
+            "message": body.get("message", "Payment creation failed"),
+            "tx_ref": tx_ref
+        }
+    
+    def _check_idempotent_payload(self, key: str, earlier: dict, payload: dict):
+        #A reused tx_ref/charge_id must describe the same request
+        if earlier != payload:
+            raise ValueError(f"Idempotency key {key!r} was already used with a different request")
+    
+    def _cached_idempotent(self, key: str, payload: dict) -> Optional[dict]:
+        #Return the earlier successful response body for key, if any
+        entry = self._idempotency_cache.get(key)
+        if entry is None:
+            return None
+        self._check_idempotent_payload(key, entry[0], payload)
+        return entry[1]
+    
+    def _cached_verify(self, key: tuple) -> Optional[Dict]:
+        #Return a copy of a cached terminal verification result, key is (kind, reference)
+        result = self._verify_cache.get(key)
+        return copy.deepcopy(result) if result is not None else None
+    
+    def _store_verify(self, key: tuple, result: Dict):
+        #Cache a copy of a verification result once it reaches a terminal status,
+        #so callers changing their result cannot change the cached one
+        if result.get("status") in TERMINAL_STATUSES:
+            self._verify_cache.set(key, copy.deepcopy(result))
+    
+    def _verify_payment_result(self, body: dict, tx_ref: str) -> Dict:
+        #Shape /payment/verify response body
+        data = body.get("data", {})
+        result = {
+            "success": True,
+            "data": data,
+            "status": data.get("status", "unknown")
+        }
+        self._store_verify(("payment", tx_ref), result)
+        return result
+    
+    def _cached_banks(self, currency: str) -> Optional[List[Dict]]:
+        #Return a copy of the cached banks for currency if still fresh
+        entry = self._banks_cache.get(currency)
+        if entry and time.monotonic() - entry[0] < self._banks_ttl:
+            return copy.deepcopy(entry[1])
+        return None
+    
+    def _banks_result(self, body: dict, currency: str) -> List[Dict]:
+        #Shape supported-banks response body, caching a copy only for a real listing
+        banks = body.get("data")
+        if not isinstance(banks, list) or body.get("status", "success") != "success":
+            return []
+        self._banks_cache[currency] = (time.monotonic(), copy.deepcopy(banks))
+        return banks
+    
+    def _build_bank_payout(self, amount: float, bank_uuid: str, account_name: str,
+                           account_number: str, charge_id: Optional[str] = None) -> Dict:
+        #Build bank transfer payout body
+        payload = _BANK_PAYOUT_TEMPLATE.copy()
+        payload.update(
+            bank_uuid=bank_uuid,
+            amount=str(amount),
+            charge_id=charge_id or self._generate_reference("bank_payout"),
+            bank_account_name=account_name,
+            bank_account_number=account_number
+        )
+        return payload
+    
+    def _build_mobile_payout(self, amount: float, mobile_number: str,
+                             charge_id: Optional[str] = None) -> Dict:
+        #Build mobile money payout body
+        bank_uuid = _MOBILE_PROVIDERS.get(_normalize_msisdn(mobile_number)[:1], TNM_UUID)
+        
+        payload = _MOBILE_PAYOUT_TEMPLATE.copy()
+        payload.update(
+            bank_uuid=bank_uuid,
+            amount=str(amount),
+            charge_id=charge_id or self._generate_reference("mobile_payout"),
+            mobile_number=mobile_number
+        )
+        return payload
+    
+    def _payout_result(self, body: dict, charge_id: str, kind: str) -> Dict:
+        #Shape payout initialize response body, kind is "Bank" or "Mobile"
+        if body.get("status") != "success":
+            return self._payout_failed(body, charge_id, kind)
+        transaction = body.get("data", {}).get("transaction", {})
+        return {
+            "success": True,
+            "ref_id": transaction.get("ref_id"),
+            "status": transaction.get("status"),
+            "charge_id": charge_id,
+            "message": f"{kind} payout created successfully"
+        }
+    
+    def _payout_failed(self, body: dict, charge_id: str, kind: str) -> Dict:
+        #Shape a failed payout initialize call, body is the error response body
+        return {
+            "success": False,
+            "message": body.get("message", f"{kind} payout failed"),
+            "charge_id": charge_id
+        }
+    
+    def _verify_payout_result(self, body: dict, ref_id: str) -> Dict:
+        #Shape payout verify response body
+        data = body.get("data", {})
+        result = {
+            "success": True,
+            "status": data.get("status"),
+            "details": data
+        }
+        self._store_verify(("payout", ref_id), result)
+        return result
+
+
+class PayChanguAPI(_PayChanguBase):
+    """
+    PayChangu API Client
+    
+    Usage:
+        api = PayChanguAPI(api_key="your_api_key")
+        result = api.create_payment(amount=1000, email="user@email.com", ...)
+        
+        # or, to release pooled connections when done
+        with PayChanguAPI(api_key="your_api_key") as api:
+            result = api.create_payment(amount=1000, email="user@email.com", ...)
+    """
+    
+    __slots__ = ("_session", "_inflight", "_inflight_lock")
+    
+    def __init__(self, api_key: str, banks_ttl: float = 300.0, debug: bool = False,
+                 idempotency_ttl: float = 60.0):
+        super().__init__(api_key, banks_ttl, debug, idempotency_ttl)
+        # POSTs currently being sent, so concurrent duplicates wait for one response
+        self._inflight: Dict[str, tuple] = {}
+        self._inflight_lock = threading.Lock()
+        
+        # Reuse one keep-alive connection pool for all calls
+        self._session = requests.Session()
+        self._session.headers.update(self._client_headers())
+        # Retry transient failures on idempotent GETs only, POSTs could double-charge
+        retry = Retry(total=GET_RETRIES, backoff_factor=RETRY_BACKOFF,
+                      status_forcelist=RETRY_STATUSES,
+                      allowed_methods=frozenset(["GET"]),
+                      respect_retry_after_header=True, raise_on_status=False)
+        self._session.mount("https://", HTTPAdapter(pool_connections=10,
+                                                    pool_maxsize=20,
+                                                    max_retries=retry))
+    
+    def close(self):
+        #Release pooled connections
+        self._session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _make_request(self, method: str, endpoint: str, data: dict = None,
+                      idempotency_key: str = None) -> dict:
+        #Make HTTP request to PayChangu API, returns the response body or raises PayChanguError
+        if method not in SUPPORTED_METHODS:
+            raise ValueError(f"Unsupported method: {method}")
+        body = _dumps(data) if data is not None else None
+        headers = {"Idempotency-Key": idempotency_key} if idempotency_key else None
+        
+        try:
+            response = self._session.request(method, self.base_url + endpoint, data=body,
+                                             headers=headers, timeout=DEFAULT_TIMEOUT)
+            return self._parse_response(response)
+        
         except requests.RequestException as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "data": {}
-            }
+            raise PayChanguError(None, {}, str(e)) from e
     
-    def create_payment(self, amount: float, email: str, first_name: str, 
+    def _post_idempotent(self, endpoint: str, payload: dict, key: str) -> dict:
+        #POST with an Idempotency-Key, reusing a recent or in-flight response for the same key.
+        #Only successful responses are kept, so a retry after an error reaches the API again.
+        #Reusing a key with a different payload raises ValueError
+        cached = self._cached_idempotent(key, payload)
+        if cached is not None:
+            return cached
+        
+        with self._inflight_lock:
+            entry = self._inflight.get(key)
+            owner = entry is None
+            if owner:
+                #An owner may have cached and left since the check above
+                cached = self._cached_idempotent(key, payload)
+                if cached is not None:
+                    return cached
+                future = Future()
+                self._inflight[key] = (payload, future)
+        if not owner:
+            self._check_idempotent_payload(key, entry[0], payload)
+            return entry[1].result()
+        
+        try:
+            body = self._make_request("POST", endpoint, payload, idempotency_key=key)
+            self._idempotency_cache.set(key, (payload, body))
+            future.set_result(body)
+            return body
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+    
+    def create_payment(self, amount: float, email: str, first_name: str,
                       last_name: str, callback_url: str, return_url: str,
-                      currency: str = "MWK", description: str = None) -> Dict:
+                      currency: str = "MWK", description: str = None,
+                      tx_ref: str = None) -> Dict:
         """
         Create a payment checkout session
         
@@ -71,88 +460,90 @@ class PayChanguAPI:
             return_url: URL to redirect after payment
             currency: Currency code (default: MWK)
             description: Payment description
-            
+            tx_ref: Reference to reuse when retrying, generated if omitted
+        
         Returns:
             dict: Payment response with checkout_url and tx_ref
         """
-        tx_ref = self._generate_reference("payment")
-        
-        payload = {
-            "amount": str(amount),
-            "currency": currency,
-            "email": email,
-            "first_name": first_name,
-            "last_name": last_name,
-            "callback_url": callback_url,
-            "return_url": return_url,
-            "tx_ref": tx_ref
-        }
-        
-        if description:
-            payload["customization"] = {
-                "title": "Payment",
-                "description": description
-            }
-        
-        response = self._make_request("POST", "/payment", payload)
-        
-        if response["success"] and response["data"].get("status") == "success":
-            checkout_data = response["data"].get("data", {})
-            return {
-                "success": True,
-                "checkout_url": checkout_data.get("checkout_url"),
-                "tx_ref": tx_ref,
-                "message": "Payment created successfully"
-            }
-        else:
-            return {
-                "success": False,
-                "message": response["data"].get("message", "Payment creation failed"),
-                "tx_ref": tx_ref
-            }
+        payload = self._build_payment(amount, email, first_name, last_name,
+                                      callback_url, return_url, currency, description, tx_ref)
+        try:
+            body = self._post_idempotent("/payment", payload, payload["tx_ref"])
+        except PayChanguError as e:
+            return self._payment_failed(e.body, payload["tx_ref"])
+        return self._payment_result(body, payload["tx_ref"])
     
     def verify_payment(self, tx_ref: str) -> Dict:
         """
-        Verify payment status
+        Verify payment status, terminal results are served from cache
         
         Args:
             tx_ref: Transaction reference
-            
+        
         Returns:
             dict: Payment verification result
         """
-        response = self._make_request("GET", f"/payment/verify/{tx_ref}")
+        cached = self._cached_verify(("payment", tx_ref))
+        if cached is not None:
+            return cached
         
-        if response["success"]:
-            return {
-                "success": True,
-                "data": response["data"].get("data", {}),
-                "status": response["data"].get("data", {}).get("status", "unknown")
-            }
-        else:
+        try:
+            body = self._make_request("GET", f"/payment/verify/{tx_ref}")
+        except PayChanguError:
             return {
                 "success": False,
                 "message": "Payment verification failed"
             }
+        return self._verify_payment_result(body, tx_ref)
     
     def get_banks(self, currency: str = "MWK") -> List[Dict]:
         """
-        Get supported banks for payouts
+        Get supported banks for payouts, cached per currency for banks_ttl seconds
         
         Args:
             currency: Currency code
-            
+        
         Returns:
             list: List of supported banks
         """
-        response = self._make_request("GET", f"/direct-charge/payouts/supported-banks?currency={currency}")
+        banks = self._cached_banks(currency)
+        if banks is not None:
+            return banks
         
-        if response["success"]:
-            return response["data"].get("data", [])
-        return []
+        endpoint = f"/direct-charge/payouts/supported-banks?currency={currency}"
+        try:
+            if ijson is None:
+                body = self._make_request("GET", endpoint)
+            else:
+                body = self._stream_banks(endpoint)
+        except PayChanguError:
+            return []
+        return self._banks_result(body, currency)
     
-    def create_bank_payout(self, amount: float, bank_uuid: str, 
-                          account_name: str, account_number: str) -> Dict:
+    def _stream_banks(self, endpoint: str) -> dict:
+        #Like _make_request("GET", endpoint), but large bodies are parsed one bank at a time
+        try:
+            with self._session.get(self.base_url + endpoint, stream=True,
+                                   timeout=DEFAULT_TIMEOUT) as response:
+                size = int(response.headers.get("Content-Length") or 0)
+                if response.status_code != 200 or size <= BANKS_STREAM_THRESHOLD:
+                    return self._parse_response(response)
+                
+                response.raw.decode_content = True
+                # Same body _parse_response would give (top-level keys, floats not
+                # Decimals), so _banks_result checks status and data the same way
+                return dict(ijson.kvitems(response.raw, "", use_float=True))
+        
+        except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
+            # Reading response.raw directly surfaces urllib3's own errors
+            # (ProtocolError, ReadTimeoutError, DecodeError) mid-stream
+            raise PayChanguError(None, {}, str(e)) from e
+        except ijson.JSONError as e:
+            raise PayChanguError(200, {}, f"Invalid JSON response: {e}") from e
+    
+    def create_bank_payout(self, amount: float, bank_uuid: str,
+                          account_name: str, account_number: str,
+                          charge_id: str = None) -> Dict:
         """
         Create bank transfer payout
         
@@ -161,108 +552,358 @@ class PayChanguAPI:
             bank_uuid: Bank UUID from get_banks()
             account_name: Bank account name
             account_number: Bank account number
-            
+            charge_id: Reference to reuse when retrying, generated if omitted
+        
         Returns:
             dict: Payout creation result
         """
-        charge_id = self._generate_reference("bank_payout")
-        
-        payload = {
-            "payout_method": "bank_transfer",
-            "bank_uuid": bank_uuid,
-            "amount": str(amount),
-            "charge_id": charge_id,
-            "bank_account_name": account_name,
-            "bank_account_number": account_number
-        }
-        
-        response = self._make_request("POST", "/direct-charge/payouts/initialize", payload)
-        
-        if response["success"] and response["data"].get("status") == "success":
-            transaction = response["data"].get("data", {}).get("transaction", {})
-            return {
-                "success": True,
-                "ref_id": transaction.get("ref_id"),
-                "status": transaction.get("status"),
-                "charge_id": charge_id,
-                "message": "Bank payout created successfully"
-            }
-        else:
-            return {
-                "success": False,
-                "message": response["data"].get("message", "Bank payout failed"),
-                "charge_id": charge_id
-            }
+        payload = self._build_bank_payout(amount, bank_uuid, account_name, account_number, charge_id)
+        try:
+            body = self._post_idempotent("/direct-charge/payouts/initialize", payload, payload["charge_id"])
+        except PayChanguError as e:
+            return self._payout_failed(e.body, payload["charge_id"], "Bank")
+        return self._payout_result(body, payload["charge_id"], "Bank")
     
-    def create_mobile_payout(self, amount: float, mobile_number: str) -> Dict:
+    def create_mobile_payout(self, amount: float, mobile_number: str,
+                             charge_id: str = None) -> Dict:
         """
         Create mobile money payout
         
         Args:
             amount: Payout amount
             mobile_number: Mobile money number
-            
+            charge_id: Reference to reuse when retrying, generated if omitted
+        
         Returns:
             dict: Payout creation result
         """
-        charge_id = self._generate_reference("mobile_payout")
-        
-        # Simple provider detection for Malawi
-        if mobile_number.startswith('09') or mobile_number.startswith('+2659'):
-            bank_uuid = "e8d5fca0-e5ac-4714-a518-484be9011326"  # Airtel Money
-        else:
-            bank_uuid = "5e9946ae-76ed-43f5-ad59-63e09096006a"  # TNM Mpamba
+        payload = self._build_mobile_payout(amount, mobile_number, charge_id)
+        try:
+            body = self._post_idempotent("/direct-charge/payouts/initialize", payload, payload["charge_id"])
+        except PayChanguError as e:
+            return self._payout_failed(e.body, payload["charge_id"], "Mobile")
+        return self._payout_result(body, payload["charge_id"], "Mobile")
+    
+    def verify_payout(self, ref_id: str) -> Dict:
+        """
+        Verify payout status, terminal results are served from cache
         
-        payload = {
-            "payout_method": "mobile_money",
-            "bank_uuid": bank_uuid,
-            "amount": str(amount),
-            "charge_id": charge_id,
-            "mobile_number": mobile_number
-        }
+        Args:
+            ref_id: Payout reference ID
         
-        response = self._make_request("POST", "/direct-charge/payouts/initialize", payload)
+        Returns:
+            dict: Payout verification result
+        """
+        cached = self._cached_verify(("payout", ref_id))
+        if cached is not None:
+            return cached
         
-        if response["success"] and response["data"].get("status") == "success":
-            transaction = response["data"].get("data", {}).get("transaction", {})
-            return {
-                "success": True,
-                "ref_id": transaction.get("ref_id"),
-                "status": transaction.get("status"),
-                "charge_id": charge_id,
-                "message": "Mobile payout created successfully"
-            }
-        else:
+        try:
+            body = self._make_request("GET", f"/direct-charge/payouts/verify/{ref_id}")
+        except PayChanguError:
             return {
                 "success": False,
-                "message": response["data"].get("message", "Mobile payout failed"),
-                "charge_id": charge_id
+                "message": "Payout verification failed"
             }
+        return self._verify_payout_result(body, ref_id)
     
-    def verify_payout(self, ref_id: str) -> Dict:
+    def run_bulk_payouts(self, payouts: List[Dict], concurrency: int = 20) -> List[Dict]:
         """
-        Verify payout status
+        Create many payouts concurrently from synchronous code
+        
+        Runs on a temporary AsyncPayChanguAPI, with the same GET retry policy as
+        this client. Uses asyncio.run, so it cannot be called from a running event
+        loop: async code should use AsyncPayChanguAPI directly.
         
         Args:
-            ref_id: Payout reference ID
+            payouts: See AsyncPayChanguAPI.create_payouts_bulk
+            concurrency: Max payouts in flight at once
+        
+        Returns:
+            list: Payout results, in the same order as payouts
+        """
+        return self._run_async(lambda api: api.create_payouts_bulk(payouts, concurrency))
+    
+    def verify_payments(self, tx_refs: List[str], concurrency: int = 20) -> Dict[str, Dict]:
+        """
+        Verify many payments concurrently
+        
+        Runs on a temporary AsyncPayChanguAPI, with the same GET retry policy as
+        this client. Uses asyncio.run, so it cannot be called from a running event
+        loop: async code should use AsyncPayChanguAPI directly.
+        
+        Args:
+            tx_refs: Transaction references
+            concurrency: Max verifications in flight at once
+        
+        Returns:
+            dict: verify_payment result for each tx_ref
+        """
+        return self._run_async(lambda api: api.verify_payments(tx_refs, concurrency))
+    
+    def verify_payouts(self, ref_ids: List[str], concurrency: int = 20) -> Dict[str, Dict]:
+        """
+        Verify many payouts concurrently
+        
+        Runs on a temporary AsyncPayChanguAPI, with the same GET retry policy as
+        this client. Uses asyncio.run, so it cannot be called from a running event
+        loop: async code should use AsyncPayChanguAPI directly.
+        
+        Args:
+            ref_ids: Payout reference IDs
+            concurrency: Max verifications in flight at once
+        
+        Returns:
+            dict: verify_payout result for each ref_id
+        """
+        return self._run_async(lambda api: api.verify_payouts(ref_ids, concurrency))
+    
+    def _run_async(self, call):
+        #Run call(api) on a temporary AsyncPayChanguAPI that shares this client's caches
+        async def run():
+            async with AsyncPayChanguAPI(self.api_key, self._banks_ttl, self.debug,
+                                         self._idempotency_cache.ttl) as api:
+                api._banks_cache = self._banks_cache
+                api._verify_cache = self._verify_cache
+                api._idempotency_cache = self._idempotency_cache
+                return await call(api)
+        
+        return asyncio.run(run())
+
+
+class AsyncPayChanguAPI(_PayChanguBase):
+    """
+    Async PayChangu API Client for running many calls concurrently.
+    Same methods and return values as PayChanguAPI, but awaitable.
+    Requires: pip install httpx[http2]
+    
+    Usage:
+        async with AsyncPayChanguAPI(api_key="your_api_key") as api:
+            results = await api.create_payments_bulk([{...}, {...}])
+            payouts = await api.create_payouts_bulk([{...}, {...}], concurrency=20)
+    """
+    
+    __slots__ = ("_client", "_inflight")
+    
+    def __init__(self, api_key: str, banks_ttl: float = 300.0, debug: bool = False,
+                 idempotency_ttl: float = 60.0):
+        if httpx is None:
+            raise ImportError("AsyncPayChanguAPI requires httpx: pip install httpx[http2]")
+        super().__init__(api_key, banks_ttl, debug, idempotency_ttl)
+        # POSTs currently being sent, so concurrent duplicates await one response
+        self._inflight: Dict[str, tuple] = {}
+        
+        # One HTTP/2 connection multiplexes concurrent calls. The transport retries
+        # failed connects (nothing was sent yet), _make_request retries GETs
+        self._client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=GET_RETRIES,
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20)
+            ),
+            headers=self._client_headers(),
+            base_url=self.base_url,
+            timeout=httpx.Timeout(30.0, connect=3.0)
+        )
+    
+    async def close(self):
+        #Release pooled connections
+        await self._client.aclose()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+    
+    async def _make_request(self, method: str, endpoint: str, data: dict = None,
+                            idempotency_key: str = None) -> dict:
+        #See PayChanguAPI._make_request, endpoint is relative to base_url.
+        #GETs get the same retry policy as the sync session: RETRY_STATUSES and
+        #transport errors are retried GET_RETRIES times with backoff, honouring Retry-After
+        if method not in SUPPORTED_METHODS:
+            raise ValueError(f"Unsupported method: {method}")
+        body = _dumps(data) if data is not None else None
+        headers = {"Idempotency-Key": idempotency_key} if idempotency_key else None
+        retries = GET_RETRIES if method == "GET" else 0
+        
+        for attempt in range(retries + 1):
+            try:
+                response = await self._client.request(method, endpoint, content=body, headers=headers)
+            except httpx.TransportError as e:
+                if attempt == retries:
+                    raise PayChanguError(None, {}, str(e)) from e
+                await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+                continue
+            except httpx.HTTPError as e:
+                raise PayChanguError(None, {}, str(e)) from e
             
+            if response.status_code not in RETRY_STATUSES or attempt == retries:
+                return self._parse_response(response)
+            await asyncio.sleep(self._retry_delay(response, attempt))
+    
+    def _retry_delay(self, response, attempt: int) -> float:
+        #Seconds to wait before retrying: Retry-After if given in seconds, else backoff
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return float(retry_after)
+        return RETRY_BACKOFF * 2 ** attempt
+    
+    async def _post_idempotent(self, endpoint: str, payload: dict, key: str) -> dict:
+        #See PayChanguAPI._post_idempotent. Every caller awaits the shared request
+        #through shield, so cancelling one caller does not cancel it for the others
+        cached = self._cached_idempotent(key, payload)
+        if cached is not None:
+            return cached
+        
+        entry = self._inflight.get(key)
+        if entry is not None:
+            self._check_idempotent_payload(key, entry[0], payload)
+            return await asyncio.shield(entry[1])
+        
+        future = asyncio.ensure_future(
+            self._make_request("POST", endpoint, payload, idempotency_key=key))
+        self._inflight[key] = (payload, future)
+        future.add_done_callback(lambda f: self._finish_idempotent(key, payload, f))
+        return await asyncio.shield(future)
+    
+    def _finish_idempotent(self, key: str, payload: dict, future: asyncio.Future):
+        #Done-callback of a shared POST: clear it from _inflight and cache a success
+        del self._inflight[key]
+        if not future.cancelled() and future.exception() is None:
+            self._idempotency_cache.set(key, (payload, future.result()))
+    
+    async def create_payment(self, amount: float, email: str, first_name: str,
+                             last_name: str, callback_url: str, return_url: str,
+                             currency: str = "MWK", description: str = None,
+                             tx_ref: str = None) -> Dict:
+        #See PayChanguAPI.create_payment
+        payload = self._build_payment(amount, email, first_name, last_name,
+                                      callback_url, return_url, currency, description, tx_ref)
+        try:
+            body = await self._post_idempotent("/payment", payload, payload["tx_ref"])
+        except PayChanguError as e:
+            return self._payment_failed(e.body, payload["tx_ref"])
+        return self._payment_result(body, payload["tx_ref"])
+    
+    async def create_payments_bulk(self, items: List[Dict]) -> List[Dict]:
+        """
+        Create many payment checkout sessions concurrently
+        
+        Args:
+            items: List of create_payment keyword arguments
+        
         Returns:
-            dict: Payout verification result
+            list: create_payment results, in the same order as items
         """
-        response = self._make_request("GET", f"/direct-charge/payouts/verify/{ref_id}")
+        return await asyncio.gather(*(self.create_payment(**i) for i in items))
+    
+    async def verify_payment(self, tx_ref: str) -> Dict:
+        #See PayChanguAPI.verify_payment
+        cached = self._cached_verify(("payment", tx_ref))
+        if cached is not None:
+            return cached
         
-        if response["success"]:
-            data = response["data"].get("data", {})
+        try:
+            body = await self._make_request("GET", f"/payment/verify/{tx_ref}")
+        except PayChanguError:
             return {
-                "success": True,
-                "status": data.get("status"),
-                "details": data
+                "success": False,
+                "message": "Payment verification failed"
             }
-        else:
+        return self._verify_payment_result(body, tx_ref)
+    
+    async def get_banks(self, currency: str = "MWK") -> List[Dict]:
+        #See PayChanguAPI.get_banks
+        banks = self._cached_banks(currency)
+        if banks is not None:
+            return banks
+        
+        try:
+            body = await self._make_request("GET", f"/direct-charge/payouts/supported-banks?currency={currency}")
+        except PayChanguError:
+            return []
+        return self._banks_result(body, currency)
+    
+    async def create_bank_payout(self, amount: float, bank_uuid: str,
+                                 account_name: str, account_number: str,
+                                 charge_id: str = None) -> Dict:
+        #See PayChanguAPI.create_bank_payout
+        payload = self._build_bank_payout(amount, bank_uuid, account_name, account_number, charge_id)
+        try:
+            body = await self._post_idempotent("/direct-charge/payouts/initialize", payload, payload["charge_id"])
+        except PayChanguError as e:
+            return self._payout_failed(e.body, payload["charge_id"], "Bank")
+        return self._payout_result(body, payload["charge_id"], "Bank")
+    
+    async def create_mobile_payout(self, amount: float, mobile_number: str,
+                                   charge_id: str = None) -> Dict:
+        #See PayChanguAPI.create_mobile_payout
+        payload = self._build_mobile_payout(amount, mobile_number, charge_id)
+        try:
+            body = await self._post_idempotent("/direct-charge/payouts/initialize", payload, payload["charge_id"])
+        except PayChanguError as e:
+            return self._payout_failed(e.body, payload["charge_id"], "Mobile")
+        return self._payout_result(body, payload["charge_id"], "Mobile")
+    
+    async def verify_payout(self, ref_id: str) -> Dict:
+        #See PayChanguAPI.verify_payout
+        cached = self._cached_verify(("payout", ref_id))
+        if cached is not None:
+            return cached
+        
+        try:
+            body = await self._make_request("GET", f"/direct-charge/payouts/verify/{ref_id}")
+        except PayChanguError:
             return {
                 "success": False,
                 "message": "Payout verification failed"
             }
+        return self._verify_payout_result(body, ref_id)
+    
+    async def create_payouts_bulk(self, payouts: List[Dict], concurrency: int = 20) -> List[Dict]:
+        """
+        Create many bank and mobile payouts concurrently
+        
+        Args:
+            payouts: List of create_mobile_payout keyword arguments (has
+                     mobile_number) or create_bank_payout keyword arguments
+            concurrency: Max payouts in flight at once
+        
+        Returns:
+            list: Payout results, in the same order as payouts
+        """
+        async def send(payout: Dict) -> Dict:
+            if "mobile_number" in payout:
+                return await self.create_mobile_payout(**payout)
+            return await self.create_bank_payout(**payout)
+        
+        return await self._map_limited(send, payouts, concurrency)
+    
+    async def verify_payments(self, tx_refs: List[str], concurrency: int = 20) -> Dict[str, Dict]:
+        #Verify many payments concurrently, returns {tx_ref: verify_payment result}
+        results = await self._map_limited(self.verify_payment, tx_refs, concurrency)
+        return dict(zip(tx_refs, results))
+    
+    async def verify_payouts(self, ref_ids: List[str], concurrency: int = 20) -> Dict[str, Dict]:
+        #Verify many payouts concurrently, returns {ref_id: verify_payout result}
+        results = await self._map_limited(self.verify_payout, ref_ids, concurrency)
+        return dict(zip(ref_ids, results))
+    
+    async def _map_limited(self, func, items: list, concurrency: int) -> List[Dict]:
+        #Await func(item) for every item with at most concurrency in flight,
+        #exceptions become failed results so one bad item does not sink the batch
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def run(item):
+            async with semaphore:
+                return await func(item)
+        
+        results = await asyncio.gather(*(run(i) for i in items), return_exceptions=True)
+        return [
+            {"success": False, "message": str(r)} if isinstance(r, Exception) else r
+            for r in results
+        ]
 
 
 # usage example
@@ -297,4 +938,4 @@ if __name__ == "__main__":
         amount=500.0,
         mobile_number="0881234567"
     )
-    print("Payout Result:", payout_result)
\ No newline at end of file
+    print("Payout Result:", payout_result)
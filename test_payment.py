@@ -0,0 +1,328 @@
+import asyncio
+import io
+import json
+import socket
+import threading
+import time
+import unittest
+from unittest import mock
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.models import Response
+
+import payment
+
+PAYOUT_OK = {"status": "success", "data": {"transaction": {"ref_id": "r1", "status": "pending"}}}
+
+
+class FakeAdapter(BaseAdapter):
+    #Answers every request with handler(request) -> (status, body) or raises what it raises
+
+    def __init__(self, handler, delay: float = 0.0):
+        super().__init__()
+        self.handler = handler
+        self.delay = delay
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        with self._lock:
+            self.requests.append(request)
+        if self.delay:
+            time.sleep(self.delay)
+        status, body = self.handler(request)
+        response = Response()
+        response.status_code = status
+        response.request = request
+        response.url = request.url
+        response.raw = io.BytesIO(json.dumps(body).encode())
+        return response
+
+    def close(self):
+        pass
+
+
+def sync_client(handler, delay: float = 0.0, **kwargs):
+    api = payment.PayChanguAPI("test_key", **kwargs)
+    adapter = FakeAdapter(handler, delay)
+    api._session.mount("https://", adapter)
+    return api, adapter
+
+
+class IdempotencyTest(unittest.TestCase):
+
+    def test_sends_charge_id_as_idempotency_key(self):
+        api, adapter = sync_client(lambda req: (200, PAYOUT_OK))
+        result = api.create_mobile_payout(500.0, "0991234567", charge_id="c1")
+        self.assertTrue(result["success"])
+        self.assertEqual(adapter.requests[0].headers["Idempotency-Key"], "c1")
+
+    def test_repeat_after_success_is_served_locally(self):
+        api, adapter = sync_client(lambda req: (200, PAYOUT_OK))
+        first = api.create_mobile_payout(500.0, "0991234567", charge_id="c1")
+        second = api.create_mobile_payout(500.0, "0991234567", charge_id="c1")
+        self.assertEqual(first, second)
+        self.assertEqual(len(adapter.requests), 1)
+
+    def test_concurrent_duplicates_share_one_request(self):
+        api, adapter = sync_client(lambda req: (200, PAYOUT_OK), delay=0.1)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(
+                api.create_mobile_payout(500.0, "0991234567", charge_id="c1")))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(adapter.requests), 1)
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(r["success"] for r in results))
+        self.assertEqual(api._inflight, {})
+
+    def test_caller_missing_cache_while_owner_finishes_sends_nothing(self):
+        api, adapter = sync_client(lambda req: (200, PAYOUT_OK))
+        missed, resume = threading.Event(), threading.Event()
+        lookup = payment.PayChanguAPI._cached_idempotent
+
+        def paused_lookup(self, key, payload):
+            cached = lookup(self, key, payload)
+            if cached is None and not missed.is_set():
+                missed.set()
+                resume.wait(5)
+            return cached
+
+        results = []
+        with mock.patch.object(payment.PayChanguAPI, "_cached_idempotent", paused_lookup):
+            late = threading.Thread(target=lambda: results.append(
+                api.create_mobile_payout(500.0, "0991234567", charge_id="c1")))
+            late.start()
+            missed.wait(5)
+            results.append(api.create_mobile_payout(500.0, "0991234567", charge_id="c1"))
+            resume.set()
+            late.join()
+        self.assertEqual(len(adapter.requests), 1)
+        self.assertTrue(all(r["success"] for r in results))
+
+    def test_error_responses_are_not_cached(self):
+        responses = iter([(500, {"message": "try again"}), (200, PAYOUT_OK)])
+        api, adapter = sync_client(lambda req: next(responses))
+        first = api.create_mobile_payout(500.0, "0991234567", charge_id="c1")
+        second = api.create_mobile_payout(500.0, "0991234567", charge_id="c1")
+        self.assertFalse(first["success"])
+        self.assertTrue(second["success"])
+        self.assertEqual(len(adapter.requests), 2)
+
+    def test_transport_errors_are_not_cached(self):
+        calls = []
+
+        def handler(req):
+            calls.append(req)
+            if len(calls) == 1:
+                raise requests.ConnectionError("connection reset")
+            return 200, PAYOUT_OK
+
+        api, adapter = sync_client(handler)
+        self.assertFalse(api.create_mobile_payout(500.0, "0991234567", charge_id="c1")["success"])
+        self.assertTrue(api.create_mobile_payout(500.0, "0991234567", charge_id="c1")["success"])
+        self.assertEqual(len(calls), 2)
+
+    def test_cached_response_expires_after_ttl(self):
+        api, adapter = sync_client(lambda req: (200, PAYOUT_OK), idempotency_ttl=60.0)
+        now = time.monotonic()
+        with mock.patch("payment.time.monotonic", return_value=now):
+            api.create_mobile_payout(500.0, "0991234567", charge_id="c1")
+        with mock.patch("payment.time.monotonic", return_value=now + 59):
+            api.create_mobile_payout(500.0, "0991234567", charge_id="c1")
+        self.assertEqual(len(adapter.requests), 1)
+        with mock.patch("payment.time.monotonic", return_value=now + 61):
+            api.create_mobile_payout(500.0, "0991234567", charge_id="c1")
+        self.assertEqual(len(adapter.requests), 2)
+
+    def test_reused_key_with_different_payload_raises(self):
+        api, adapter = sync_client(lambda req: (200, PAYOUT_OK))
+        api.create_mobile_payout(500.0, "0991234567", charge_id="c1")
+        with self.assertRaises(ValueError):
+            api.create_mobile_payout(900.0, "0991234567", charge_id="c1")
+        self.assertEqual(len(adapter.requests), 1)
+
+
+class MobileProviderTest(unittest.TestCase):
+
+    def provider(self, number: str) -> str:
+        return payment.PayChanguAPI("test_key")._build_mobile_payout(1.0, number)["bank_uuid"]
+
+    def test_normalize_msisdn(self):
+        for number in ("0991234567", "991234567", "+265991234567", "265991234567",
+                       "00265991234567", "+265 99 123 4567", " 099 123 4567 "):
+            self.assertEqual(payment._normalize_msisdn(number), "991234567", number)
+
+    def test_airtel_numbers(self):
+        for number in ("0991234567", "0981234567", "991234567", "+265991234567",
+                       "265991234567", "00265991234567", "+265 99 123 4567"):
+            self.assertEqual(self.provider(number), payment.AIRTEL_UUID, number)
+
+    def test_tnm_numbers(self):
+        for number in ("0881234567", "+265881234567", "00265881234567", "+265 88 123 4567"):
+            self.assertEqual(self.provider(number), payment.TNM_UUID, number)
+
+
+class TTLCacheTest(unittest.TestCase):
+
+    def test_concurrent_get_set_and_expiry(self):
+        cache = payment._TTLCache(maxsize=8, ttl=0.0005)
+        errors = []
+
+        def hammer():
+            try:
+                for i in range(5000):
+                    cache.set(i % 16, i)
+                    cache.get((i * 7) % 16)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=hammer) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+
+
+def serve_once(raw_response: bytes) -> int:
+    #Answer one HTTP request on localhost with raw_response, then drop the connection
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+
+    def run():
+        conn, _ = server.accept()
+        with conn:
+            conn.recv(65536)
+            conn.sendall(raw_response)
+        server.close()
+
+    threading.Thread(target=run, daemon=True).start()
+    return server.getsockname()[1]
+
+
+@unittest.skipIf(payment.ijson is None, "ijson not installed")
+class StreamBanksTest(unittest.TestCase):
+
+    def banks_body(self, status: str = "success") -> bytes:
+        banks = [{"uuid": str(i), "name": f"Bank {i}", "fee": 1.5} for i in range(3000)]
+        body = json.dumps({"status": status, "data": banks}).encode()
+        self.assertGreater(len(body), payment.BANKS_STREAM_THRESHOLD)
+        return body
+
+    def client_for(self, raw_response: bytes) -> payment.PayChanguAPI:
+        api = payment.PayChanguAPI("test_key")
+        api.base_url = f"http://127.0.0.1:{serve_once(raw_response)}"
+        return api
+
+    def ok_response(self, body: bytes) -> bytes:
+        return f"HTTP/1.1 200 OK\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body
+
+    def test_large_listing_is_streamed(self):
+        banks = self.client_for(self.ok_response(self.banks_body())).get_banks()
+        self.assertEqual(len(banks), 3000)
+        self.assertIsInstance(banks[0]["fee"], float)
+
+    def test_large_error_body_is_not_cached(self):
+        api = self.client_for(self.ok_response(self.banks_body(status="error")))
+        self.assertEqual(api.get_banks(), [])
+        self.assertIsNone(api._cached_banks("MWK"))
+
+    def test_large_non_list_data_is_not_cached(self):
+        body = json.dumps({"status": "success", "data": {"note": "x" * 70000}}).encode()
+        api = self.client_for(self.ok_response(body))
+        self.assertEqual(api.get_banks(), [])
+        self.assertIsNone(api._cached_banks("MWK"))
+
+    def test_truncated_stream_returns_empty_list(self):
+        body = self.banks_body()
+        headers = f"HTTP/1.1 200 OK\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+        api = self.client_for(headers + body[:len(body) // 2])
+        self.assertEqual(api.get_banks(), [])
+        self.assertIsNone(api._cached_banks("MWK"))
+
+
+@unittest.skipIf(payment.httpx is None, "httpx not installed")
+class AsyncIdempotencyTest(unittest.TestCase):
+
+    async def make_client(self, handler):
+        httpx = payment.httpx
+        api = payment.AsyncPayChanguAPI("test_key")
+        await api._client.aclose()
+        api._client = httpx.AsyncClient(transport=httpx.MockTransport(handler),
+                                        base_url=api.base_url,
+                                        headers=api._client_headers())
+        return api
+
+    def test_concurrent_duplicates_share_one_request(self):
+        calls = []
+
+        async def handler(request):
+            calls.append(request)
+            await asyncio.sleep(0.05)
+            return payment.httpx.Response(200, json=PAYOUT_OK)
+
+        async def run():
+            async with await self.make_client(handler) as api:
+                results = await asyncio.gather(*(
+                    api.create_bank_payout(500.0, "b1", "Ann Banda", "1001", charge_id="c1")
+                    for _ in range(5)))
+                return results, api._inflight
+
+        results, inflight = asyncio.run(run())
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(r["success"] for r in results))
+        self.assertEqual(inflight, {})
+
+    def test_cancelling_first_caller_does_not_cancel_duplicates(self):
+        async def handler(request):
+            await asyncio.sleep(0.05)
+            return payment.httpx.Response(200, json=PAYOUT_OK)
+
+        async def run():
+            async with await self.make_client(handler) as api:
+                first = asyncio.ensure_future(
+                    api.create_bank_payout(500.0, "b1", "Ann Banda", "1001", charge_id="c2"))
+                await asyncio.sleep(0)
+                second = asyncio.ensure_future(
+                    api.create_bank_payout(500.0, "b1", "Ann Banda", "1001", charge_id="c2"))
+                await asyncio.sleep(0)
+                first.cancel()
+                return await second, first.cancelled()
+
+        result, first_cancelled = asyncio.run(run())
+        self.assertTrue(first_cancelled)
+        self.assertTrue(result["success"])
+
+    def test_gets_retry_transient_statuses_but_posts_do_not(self):
+        calls = []
+
+        async def handler(request):
+            calls.append(request.method)
+            if len(calls) == 1 or request.method == "POST":
+                return payment.httpx.Response(503, json={"message": "busy"})
+            return payment.httpx.Response(200, json={"status": "success", "data": []})
+
+        async def run():
+            async with await self.make_client(handler) as api:
+                with mock.patch("payment.asyncio.sleep", mock.AsyncMock()) as sleep:
+                    banks = await api.get_banks()
+                    payout = await api.create_bank_payout(500.0, "b1", "Ann Banda", "1001")
+                return banks, payout, sleep.await_count
+
+        banks, payout, sleeps = asyncio.run(run())
+        self.assertEqual(banks, [])
+        self.assertFalse(payout["success"])
+        self.assertEqual(calls, ["GET", "GET", "POST"])
+        self.assertEqual(sleeps, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()